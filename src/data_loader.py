@@ -11,8 +11,23 @@ Author: Prince
 Project: AI Model Hallucination Tracker
 """
 
+import re
+
 import pandas as pd
 from pathlib import Path
+from typing import Iterator, Optional, Union
+
+# Compiled once at import; collapses any run of whitespace
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# The multi-threaded Arrow CSV parser is much faster than the default
+# C engine on large dumps; fall back silently if pyarrow is missing
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:  # pragma: no cover
+    CSV_ENGINE = "c"
 
 
 class DataLoader:
@@ -21,7 +36,11 @@ class DataLoader:
         self.raw_path = self.base_path / "raw"
         self.processed_path = self.base_path / "processed"
 
-        # Ensure folders exist
+    def _ensure_dirs(self) -> None:
+        """
+        Creates the data folders lazily, only when writing -- loads
+        already fail cleanly on a missing path
+        """
         self.raw_path.mkdir(parents=True, exist_ok=True)
         self.processed_path.mkdir(parents=True, exist_ok=True)
 
@@ -29,18 +48,32 @@ class DataLoader:
     # Loaders
     # -----------------------------
     def load_questions(self, filename: str = "questions.csv") -> pd.DataFrame:
-        file_path = self.raw_path / filename
-        if not file_path.exists():
-            raise FileNotFoundError(f"{filename} not found in data/raw/")
-        return pd.read_csv(file_path)
+        # No exists() pre-check: read_csv raises FileNotFoundError
+        # itself, so the extra stat syscall buys nothing
+        return pd.read_csv(self.raw_path / filename, engine=CSV_ENGINE)
 
     def load_model_responses(
-        self, filename: str = "model_responses_raw.csv"
-    ) -> pd.DataFrame:
+        self,
+        filename: str = "model_responses_raw.csv",
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Loads raw responses with the Arrow CSV engine when available.
+
+        For files too large for memory, pass chunksize (e.g. 1_000_000)
+        to get an iterator of DataFrames instead, so cleaning and
+        detection can run chunk by chunk.
+        """
         file_path = self.raw_path / filename
-        if not file_path.exists():
-            raise FileNotFoundError(f"{filename} not found in data/raw/")
-        return pd.read_csv(file_path)
+
+        # model_name repeats a handful of values -> categorical dtype
+        dtype = {"model_name": "category"}
+
+        if chunksize is not None:
+            # The pyarrow engine does not support chunked reads
+            return pd.read_csv(file_path, dtype=dtype, chunksize=chunksize)
+
+        return pd.read_csv(file_path, dtype=dtype, engine=CSV_ENGINE)
 
     # -----------------------------
     # Cleaning
@@ -52,31 +85,59 @@ class DataLoader:
         - Strip whitespace
         - Normalize text
         """
-        df = df.copy()
-
         if "response_text" not in df.columns:
             raise ValueError("Column 'response_text' is required")
 
-        df["response_text"] = (
-            df["response_text"]
-            .astype(str)
-            .str.strip()
-            .str.replace(r"\s+", " ", regex=True)
+        # One substitution pass normalizes whitespace, then a single
+        # strip trims the edges -- no extra intermediate Series.
+        # assign() shares the untouched column buffers with the input
+        # instead of copying the whole frame.
+        df = df.assign(
+            response_text=(
+                df["response_text"]
+                .astype("string")
+                .str.replace(_WHITESPACE_RE, " ", regex=True)
+                .str.strip()
+            )
         )
 
-        df = df[df["response_text"].str.len() > 10]
-        df.reset_index(drop=True, inplace=True)
+        mask = df["response_text"].str.len() > 10
+        df = df.loc[mask].reset_index(drop=True)
 
         return df
 
+    def load_processed(
+        self, filename: str = "cleaned_responses.parquet"
+    ) -> pd.DataFrame:
+        """
+        Reads a processed dataset back, dispatching on the suffix.
+        """
+        file_path = self.processed_path / filename
+        if file_path.suffix == ".csv":
+            return pd.read_csv(file_path, engine=CSV_ENGINE)
+        if file_path.suffix == ".feather":
+            return pd.read_feather(file_path)
+        return pd.read_parquet(file_path)
+
     # -----------------------------
     # Save processed data
     # -----------------------------
     def save_processed(
-        self, df: pd.DataFrame, filename: str = "cleaned_responses.csv"
+        self, df: pd.DataFrame, filename: str = "cleaned_responses.parquet"
     ) -> None:
+        """
+        Writes Parquet by default: binary columnar output keeps the
+        category/int8/float32 dtypes and skips text re-encoding.
+        Pass a .csv or .feather filename to switch formats.
+        """
+        self._ensure_dirs()
         output_path = self.processed_path / filename
-        df.to_csv(output_path, index=False)
+        if output_path.suffix == ".csv":
+            df.to_csv(output_path, index=False)
+        elif output_path.suffix == ".feather":
+            df.to_feather(output_path)
+        else:
+            df.to_parquet(output_path, engine="pyarrow", compression="zstd")
         print(f"✅ Saved processed data to {output_path}")
 
 
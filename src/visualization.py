@@ -23,6 +23,7 @@ sys.path.append(str(ROOT_DIR))
 # Imports
 # -------------------------------
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 
 from src.data_loader import DataLoader
@@ -35,74 +36,82 @@ class HallucinationVisualizer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Shared figure settings; constrained_layout replaces the
+        # per-figure tight_layout() renderer rerun
+        self.rc_params = {
+            "figure.figsize": (6, 4),
+            "figure.constrained_layout.use": True,
+        }
+
+    # ---------------------------------
+    # Figure helpers
+    # ---------------------------------
+    def _new_figure(self):
+        with plt.rc_context(self.rc_params):
+            return plt.subplots()
+
+    def _save_figure(self, fig, filename: str) -> None:
+        output_path = self.output_dir / filename
+        fig.savefig(output_path, dpi=100)
+        plt.close(fig)
+        print(f"📊 Saved: {output_path}")
+
     # ---------------------------------
     # Hallucination rate per model
     # ---------------------------------
     def plot_hallucination_rate(self, summary_df: pd.DataFrame):
-        plt.figure()
-        plt.bar(
+        fig, ax = self._new_figure()
+        ax.bar(
             summary_df["model_name"],
             summary_df["hallucination_rate"],
         )
-        plt.xlabel("Model")
-        plt.ylabel("Hallucination Rate")
-        plt.title("Hallucination Rate by Model")
-        plt.tight_layout()
-
-        output_path = self.output_dir / "hallucination_rate.png"
-        plt.savefig(output_path)
-        plt.close()
+        ax.set_xlabel("Model")
+        ax.set_ylabel("Hallucination Rate")
+        ax.set_title("Hallucination Rate by Model")
 
-        print(f"📊 Saved: {output_path}")
+        self._save_figure(fig, "hallucination_rate.png")
 
     # ---------------------------------
     # Confidence score distribution
     # ---------------------------------
     def plot_confidence_distribution(self, scored_df: pd.DataFrame):
-        plt.figure()
-        plt.hist(scored_df["confidence_score"], bins=10)
-        plt.xlabel("Confidence Score")
-        plt.ylabel("Frequency")
-        plt.title("Confidence Score Distribution")
-        plt.tight_layout()
+        fig, ax = self._new_figure()
+        ax.hist(scored_df["confidence_score"], bins=10)
+        ax.set_xlabel("Confidence Score")
+        ax.set_ylabel("Frequency")
+        ax.set_title("Confidence Score Distribution")
 
-        output_path = self.output_dir / "confidence_distribution.png"
-        plt.savefig(output_path)
-        plt.close()
-
-        print(f"📊 Saved: {output_path}")
+        self._save_figure(fig, "confidence_distribution.png")
 
     # ---------------------------------
     # Risk score comparison
     # ---------------------------------
     def plot_risk_score_by_label(self, scored_df: pd.DataFrame):
-        plt.figure()
-
-        labels = scored_df["final_label"].unique()
-        data = [
-            scored_df[scored_df["final_label"] == label][
-                "hallucination_risk_score"
-            ]
-            for label in labels
-        ]
+        fig, ax = self._new_figure()
 
-        plt.boxplot(data, labels=labels)
-        plt.xlabel("Final Label")
-        plt.ylabel("Hallucination Risk Score")
-        plt.title("Risk Score by Prediction Label")
-        plt.tight_layout()
+        # One groupby pass collects every label's scores at once,
+        # instead of rescanning the full column per label
+        groups = scored_df.groupby("final_label", sort=False, observed=True)[
+            "hallucination_risk_score"
+        ]
+        labels = list(groups.groups.keys())
+        data = [group.to_numpy() for _, group in groups]
 
-        output_path = self.output_dir / "risk_score_by_label.png"
-        plt.savefig(output_path)
-        plt.close()
+        ax.boxplot(data, tick_labels=labels)
+        ax.set_xlabel("Final Label")
+        ax.set_ylabel("Hallucination Risk Score")
+        ax.set_title("Risk Score by Prediction Label")
 
-        print(f"📊 Saved: {output_path}")
+        self._save_figure(fig, "risk_score_by_label.png")
 
 
 # ---------------------------------
 # MAIN EXECUTION
 # ---------------------------------
 if __name__ == "__main__":
+    # Headless batch run: skip GUI backend setup entirely
+    matplotlib.use("Agg")
+
     loader = DataLoader()
     detector = HallucinationDetector()
     scorer = HallucinationScorer()